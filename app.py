@@ -1,19 +1,420 @@
 import streamlit as st
 from dotenv import load_dotenv
 import os
-import json
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from typing import TYPE_CHECKING, Optional
+from cachetools import TTLCache
 
-# Import from youtube_rag.py (your main module)
-from src.rag_pipeline import (
-    EnrichmentConfig,
-    create_rag_system,
-    SourceTracker
+from src.ui_config import (
+    PRESET_OPTIONS, PRESET_INFO, CONFIG_FACTORIES, SUMMARY_TYPE_MAP, SUMMARY_TYPE_DISPLAY,
+    CUSTOM_CSS, FOOTER_HTML
 )
 
-def main():
-    load_dotenv()
+# src.rag_pipeline pulls in langchain, FAISS and the embedding stack, so it
+# is imported where it's first needed rather than before the page renders
+if TYPE_CHECKING:
+    from src.rag_pipeline import EnrichmentConfig, SourceTracker
+
+@st.cache_resource(ttl=60, show_spinner=False)
+def _load_env():
+    """Load .env and read API keys at most once a minute, not on every rerun"""
+    load_dotenv(override=True)
+    return os.getenv("GROQ_API_KEY"), os.getenv("SERPER_API_KEY")
+
+# Static HTML is emitted from cached functions; Streamlit replays the
+# element on cache hits, so it still appears on every rerun
+@st.cache_resource(show_spinner=False)
+def _inject_css() -> bool:
+    st.markdown(CUSTOM_CSS, unsafe_allow_html=True)
+    return True
+
+@st.cache_resource(show_spinner=False)
+def _render_footer() -> bool:
+    st.markdown(FOOTER_HTML, unsafe_allow_html=True)
+    return True
+
+@st.cache_resource
+def _preset(preset_key: str) -> "EnrichmentConfig":
+    """Build each enrichment preset once per server process"""
+    from src.rag_pipeline import EnrichmentConfig
+    return getattr(EnrichmentConfig, CONFIG_FACTORIES[preset_key])()
+
+@st.cache_resource(max_entries=8, show_spinner=False)
+def _build_rag(video_id: str, cfg_key: tuple, _url: str, _progress: Optional[dict] = None):
+    """
+    Build the RAG system for a video/config once and share it across sessions
+    Keyed on video ID, so any URL form of the same video hits the same entry
+    """
+    from src.rag_pipeline import EnrichmentConfig, cached_create_rag_system
+    return cached_create_rag_system(_url, EnrichmentConfig.from_cache_key(cfg_key), _progress)
+
+@st.cache_data(ttl=10)
+def _tracker_summary(tracker_id: int, n_hist: int, _tracker: "SourceTracker") -> dict:
+    """Tracker summary, recomputed only when the tracker or chat length changes"""
+    return _tracker.get_summary()
+
+# Generated content is cached per video/config across reruns and sessions.
+# Failed generations raise, which keeps them out of the cache.
+
+@st.cache_resource
+def _summary_store() -> tuple:
+    """
+    Streamed single summaries, keyed by (video_id, cfg_key, summary_type)
+    Shared by every session thread and TTLCache isn't thread-safe, so it
+    comes with the lock that guards it
+    """
+    return TTLCache(maxsize=256, ttl=24 * 3600), threading.Lock()
+
+@st.cache_data(ttl=24 * 3600, show_spinner=False)
+def _cached_all_summaries(video_id: str, cfg_key: tuple, _chain) -> dict:
+    summaries = _chain.generate_all_summaries()
+    for summary in summaries.values():
+        if summary.get('error'):
+            raise Exception(summary['summary'])
+    return summaries
+
+@st.cache_data(ttl=24 * 3600, show_spinner=False)
+def _cached_auto_qa(video_id: str, cfg_key: tuple, num_questions: int, _chain) -> list:
+    qa_pairs = _chain.generate_auto_qa(num_questions=num_questions)
+    if not qa_pairs:
+        raise Exception("No questions could be generated")
+    return qa_pairs
+
+def _normalize_question(question: str) -> str:
+    """Lowercase, strip punctuation and collapse whitespace for cache lookups"""
+    return re.sub(r'\s+', ' ', re.sub(r'[^\w\s]', '', question.lower())).strip()
+
+# Export payloads are cached process-wide and every chat turn adds new
+# ones, so they are bounded and expire
+
+def _gzip_json(data) -> bytes:
+    """Serialize to indented JSON with orjson and gzip it for download"""
+    import gzip
+    import orjson
+    return gzip.compress(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+
+@st.cache_data(max_entries=64, ttl=3600, show_spinner=False)
+def _chat_bytes(history_key: tuple, _history: list) -> bytes:
+    """Serialize chat history once per distinct history"""
+    return _gzip_json(_history)
+
+def _session_report(tracker: "SourceTracker", history: list) -> dict:
+    """
+    Source report for this session only
+    The tracker is shared by every session viewing the video (see _build_rag),
+    so its query_history mixes users; the query log comes from this
+    session's chat history instead
+    """
+    return {
+        'summary': tracker.get_summary(),
+        'query_history': [
+            {
+                'timestamp': chat['timestamp'],
+                'question': chat['question'],
+                'answer_preview': chat['answer'][:200],
+                'sources_used': chat['sources']
+            }
+            for chat in history
+        ],
+        'generated_at': datetime.now().isoformat()
+    }
+
+@st.cache_data(max_entries=64, ttl=3600, show_spinner=False)
+def _report_bytes(history_key: tuple, tracker_id: int, _tracker: "SourceTracker", _history: list) -> bytes:
+    """Serialize this session's source report once per tracker and history"""
+    return _gzip_json(_session_report(_tracker, _history))
+
+@st.cache_data(max_entries=64, ttl=3600, show_spinner=False)
+def _all_data_bytes(history_key: tuple, tracker_id: int, _tracker: "SourceTracker", _history: list) -> bytes:
+    """Serialize source report and chat history into one document"""
+    return _gzip_json({
+        'source_report': _session_report(_tracker, _history),
+        'chat_history': _history
+    })
+
+def _reset_session():
+    """Forget this session's video along with everything generated for it"""
+    st.session_state.rag_key = None
+    st.session_state.chat_history = []
+    st.session_state.auto_qa = []
+    st.session_state.summaries = {}
+    st.session_state.answer_cache.clear()
+    st.session_state.analytics_rows = ()
+
+def _clear_chat():
+    """Button callback: drop the chat history before the next run renders it"""
+    st.session_state.chat_history = []
+
+@st.fragment
+def _summaries_panel(rag_chain):
+    """Summary generation and display (fragment: reruns on its own)"""
+    st.markdown("---")
+    st.subheader("📝 Video Summaries")
+    
+    # Summary type selector
+    summary_col1, summary_col2 = st.columns([3, 1])
+    with summary_col1:
+        summary_type = st.selectbox(
+            "Choose summary type:",
+            list(SUMMARY_TYPE_MAP),
+            key="summary_type"
+        )
+    with summary_col2:
+        st.write("")
+        st.write("")
+        generate_summary_btn = st.button("📝 Generate", key="gen_summary")
     
+    # Generate summary on button click
+    if generate_summary_btn:
+        selected_type = SUMMARY_TYPE_MAP[summary_type]
+        store_key = (*st.session_state.rag_key[:2], selected_type)
+        stream_area = st.empty()
+        store, store_lock = _summary_store()
+        try:
+            with store_lock:
+                summary = store.get(store_key)
+            if summary is None:
+                # Show tokens as they arrive; the finished summary is listed below
+                with stream_area.container():
+                    text = st.write_stream(rag_chain.stream_summary(selected_type))
+                summary = {
+                    'type': selected_type,
+                    'summary': text,
+                    'video_title': rag_chain.metadata.get('title', 'this video'),
+                    'generated_at': datetime.now().isoformat()
+                }
+                with store_lock:
+                    store[store_key] = summary
+            st.session_state.summaries[selected_type] = summary
+            st.success(f"✅ {summary_type} summary generated!")
+        except Exception as e:
+            error_msg = str(e)
+            if "rate_limit" in error_msg.lower() or "429" in error_msg:
+                # Extract wait time if available
+                wait_match = re.search(r'try again in ([\d\.]+[msh]+)', error_msg)
+                wait_time = wait_match.group(1) if wait_match else "a few minutes"
+                
+                st.error(f"⚠️ **Groq API Rate Limit Reached**")
+                st.warning(f"""
+                You've used up your daily token limit (100,000 tokens/day).
+                
+                **Wait time:** ~{wait_time}
+                
+                **Options:**
+                - ⏰ Wait for the limit to reset
+                - 💰 Upgrade at [Groq Console](https://console.groq.com/settings/billing)
+                - 💬 Continue using the chat (uses fewer tokens)
+                """)
+            else:
+                st.error(f"❌ Error: {error_msg}")
+        finally:
+            stream_area.empty()
+    
+    # Summaries render here, but are filled in after the Generate All button
+    # below has run, so newly generated ones show without a rerun
+    summaries_area = st.container()
+    
+    # Option to generate all summaries at once
+    if st.button("📚 Generate All Summary Types", key="gen_all_summaries"):
+        with st.spinner("Generating all summary types... This may take a minute."):
+            try:
+                all_summaries = _cached_all_summaries(*st.session_state.rag_key[:2], rag_chain)
+                st.session_state.summaries = all_summaries
+                st.success("✅ All summaries generated!")
+            except Exception as e:
+                error_msg = str(e)
+                if "rate_limit" in error_msg.lower() or "429" in error_msg:
+                    st.error("⚠️ Rate limit reached! Please wait a few minutes and try again.")
+                    st.info("💡 Tip: Generate one summary at a time to conserve tokens.")
+                else:
+                    st.error(f"❌ Error: {error_msg}")
+    
+    with summaries_area:
+        if st.session_state.summaries:
+            st.markdown("### Generated Summaries:")
+            # One tabs widget instead of an open expander per summary
+            summaries = st.session_state.summaries
+            tabs = st.tabs([SUMMARY_TYPE_DISPLAY.get(stype, stype.title()) for stype in summaries])
+            for tab, summary_data in zip(tabs, summaries.values()):
+                with tab:
+                    st.markdown(summary_data['summary'])
+                    st.caption(f"Generated at: {summary_data['generated_at']}")
+
+@st.fragment
+def _qa_panel(rag_chain):
+    """Auto-generated Q&A (fragment: reruns on its own)"""
+    st.markdown("---")
+    st.subheader("🤖 Auto-Generated Q&A")
+    st.caption("⚠️ Note: This feature uses significant API tokens. Use sparingly if near rate limits.")
+    
+    qa_col1, qa_col2 = st.columns([3, 1])
+    with qa_col1:
+        num_questions = st.slider("Number of questions:", 1, 10, 5, key="num_qa")
+    with qa_col2:
+        st.write("")
+        st.write("")
+        generate_qa_btn = st.button("🤖 Generate Q&A", key="gen_qa")
+    
+    # Generate Q&A on button click
+    if generate_qa_btn:
+        with st.spinner(f"Generating {num_questions} questions and answers..."):
+            try:
+                auto_qa = _cached_auto_qa(*st.session_state.rag_key[:2], num_questions, rag_chain)
+                st.session_state.auto_qa = auto_qa
+            except Exception as e:
+                if "rate_limit" in str(e).lower():
+                    st.error("⚠️ Rate limit reached! Please wait and try again later.")
+                    st.info("💡 Your daily token limit has been exceeded. Try again in about 30 minutes, or reduce the number of questions.")
+                else:
+                    st.error(f"Error generating Q&A: {str(e)}")
+    
+    # Display generated Q&A
+    if st.session_state.auto_qa:
+        st.markdown("### Generated Questions & Answers:")
+        for i, qa in enumerate(st.session_state.auto_qa, 1):
+            with st.expander(f"❓ {qa['question']}", expanded=(i==1)):
+                st.markdown(f"**Answer:** {qa['answer']}")
+                st.caption(f"Source: AI-generated based on video content")
+
+def _analytics_panel(tracker):
+    """
+    Analytics and exports
+    Drawn inside the chat fragment, so it is rebuilt or removed whenever the
+    chat history changes, including after Clear Chat
+    """
+    st.markdown("---")
+    st.header("📊 Analytics")
+    
+    # Expanders still execute their body, so gate the stats with a toggle
+    if st.toggle("📊 Show Analytics", value=False):
+        summary = _tracker_summary(id(tracker), len(st.session_state.chat_history), tracker)
+        sources_by_type = summary['sources_by_type']
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            st.subheader("Query Statistics")
+            st.metric("Total Questions", len(st.session_state.chat_history))
+            st.metric("Sources Used", summary['used_sources'])
+            st.metric("Source Types", len(sources_by_type))
+        
+        with col2:
+            st.subheader("Source Breakdown")
+            for title, count in st.session_state.analytics_rows:
+                st.write(f"**{title}:** {count}")
+    
+    # Export options (serialized in memory, downloaded by the browser).
+    # Payloads are cached per history, and clicking a download doesn't rerun
+    st.subheader("📥 Export Data")
+    col1, col2, col3 = st.columns(3)
+    
+    history = st.session_state.chat_history
+    history_key = tuple(chat['timestamp'] for chat in history)
+    
+    with col1:
+        st.download_button(
+            "Export Source Report (JSON, gzip)",
+            _report_bytes(history_key, id(tracker), tracker, history),
+            "source_report.json.gz",
+            "application/gzip",
+            on_click="ignore"
+        )
+    
+    with col2:
+        st.download_button(
+            "Export Chat History (JSON, gzip)",
+            _chat_bytes(history_key, history),
+            "chat_history.json.gz",
+            "application/gzip",
+            on_click="ignore"
+        )
+    
+    with col3:
+        st.download_button(
+            "Export All Data (JSON, gzip)",
+            _all_data_bytes(history_key, id(tracker), tracker, history),
+            "full_report.json.gz",
+            "application/gzip",
+            on_click="ignore"
+        )
+
+@st.fragment
+def _chat_panel(rag_chain, tracker, metadata: dict):
+    """
+    Chat history, input, analytics and exports
+    Runs as a fragment, so asking a question only reruns this panel rather
+    than the sidebar and summaries. Analytics are drawn here too, since this
+    is where chat_history changes
+    """
+    st.markdown("---")
+    st.header("💬 Ask Questions")
+    
+    # Display chat history
+    for chat in st.session_state.chat_history:
+        with st.chat_message("user"):
+            st.write(chat['question'])
+        with st.chat_message("assistant"):
+            st.write(chat['answer'])
+            if chat.get('sources'):
+                st.caption(f"📎 Sources: {', '.join(chat['sources'])}")
+    
+    # Question input (submits on Enter only, so typing doesn't rerun the script)
+    user_question = st.chat_input("What is this video about?")
+    
+    if user_question:
+        with st.chat_message("user"):
+            st.write(user_question)
+        
+        with st.chat_message("assistant"):
+            try:
+                # Exact repeats (after normalization) are answered here without
+                # embedding; paraphrases hit the chain's own semantic cache
+                cache_key = (metadata['video_id'], _normalize_question(user_question))
+                cached = st.session_state.answer_cache.get(cache_key)
+                
+                if cached is not None:
+                    answer, sources = cached
+                    st.write(answer)
+                else:
+                    # Stream the answer, remembering which sources it drew on
+                    sources = []
+                    def answer_tokens():
+                        for token, sources_used in rag_chain.stream_with_sources(user_question):
+                            sources[:] = sources_used
+                            yield token
+                    
+                    answer = st.write_stream(answer_tokens())
+                    st.session_state.answer_cache[cache_key] = (answer, sources)
+                
+                if sources:
+                    st.caption(f"📎 Sources: {', '.join(sources)}")
+                
+                # Add to chat history (no rerun, it would discard the stream)
+                st.session_state.chat_history.append({
+                    'question': user_question,
+                    'answer': answer,
+                    'sources': sources,
+                    'timestamp': datetime.now().isoformat()
+                })
+                
+            except Exception as e:
+                st.error(f"❌ Error: {str(e)}")
+    
+    # After the new turn is rendered in place, so it shows from the first answer on.
+    # The callback clears history before the fragment reruns, which also drops
+    # the analytics and exports below, so no explicit rerun
+    if st.session_state.chat_history:
+        st.button("Clear Chat", on_click=_clear_chat)
+    
+    # Analytics section (once there is something to analyse)
+    if tracker and st.session_state.chat_history:
+        _analytics_panel(tracker)
+
+def main():
     st.set_page_config(
         page_title="YouTube RAG Chatbot Pro",
         page_icon="🎥",
@@ -21,43 +422,33 @@ def main():
     )
     
     # Custom CSS for better UI
-    st.markdown("""
-        <style>
-        .source-box {
-            background-color: #f0f2f6;
-            padding: 10px;
-            border-radius: 5px;
-            margin: 5px 0;
-        }
-        .metric-card {
-            background-color: #e8f4f8;
-            padding: 15px;
-            border-radius: 8px;
-            text-align: center;
-        }
-        </style>
-    """, unsafe_allow_html=True)
+    _inject_css()
     
     st.title("🎥 YouTube RAG Chatbot Pro")
     st.markdown("*Advanced RAG with intelligent web enrichment and source tracking*")
     
     # Initialize session state
-    if 'rag_chain' not in st.session_state:
-        st.session_state.rag_chain = None
-        st.session_state.tracker = None
-        st.session_state.metadata = None
+    if 'rag_key' not in st.session_state:
+        st.session_state.rag_key = None  # (video_id, config key, url) handle into _build_rag
         st.session_state.chat_history = []
         st.session_state.auto_qa = []
         st.session_state.summaries = {}
+        st.session_state.answer_cache = TTLCache(maxsize=500, ttl=1800)
+        st.session_state.analytics_rows = ()  # (title, count) per source type
+    
+    # Load API keys before anything that may build a RAG system
+    groq_key, serper_key = _load_env()
+    
+    # Resolve this session's RAG system from the shared cache
+    rag_chain = tracker = metadata = None
+    if st.session_state.rag_key:
+        rag_chain, tracker, metadata = _build_rag(*st.session_state.rag_key)
     
     # Sidebar for configuration
     with st.sidebar:
         st.header("⚙️ Configuration")
         
         # Check API keys
-        groq_key = os.getenv("GROQ_API_KEY")
-        serper_key = os.getenv("SERPER_API_KEY")
-        
         st.subheader("API Status")
         st.write("✅ Groq API" if groq_key else "❌ Groq API (Required)")
         st.write("✅ Serper API" if serper_key else "⚠️ Serper API (Optional)")
@@ -70,33 +461,17 @@ def main():
         # Enrichment preset selection
         st.subheader("🔍 Enrichment Mode")
         
-        preset_options = {
-            "Transcript Only (Fastest)": "transcript_only",
-            "Minimal (Background)": "minimal",
-            "Balanced (Recommended)": "balanced",
-            "Comprehensive (All Sources)": "comprehensive",
-            "Academic (Research Focus)": "academic"
-        }
-        
         selected_preset = st.selectbox(
             "Choose preset:",
-            options=list(preset_options.keys()),
+            options=list(PRESET_OPTIONS.keys()),
             index=2  # Default to Balanced
         )
         
-        preset_key = preset_options[selected_preset]
+        preset_key = PRESET_OPTIONS[selected_preset]
         
         # Show what this preset includes
-        preset_info = {
-            "transcript_only": {"strategies": [], "desc": "Video transcript only - fastest and most accurate to video content"},
-            "minimal": {"strategies": ["background"], "desc": "Adds basic background context"},
-            "balanced": {"strategies": ["background", "discussions"], "desc": "Best balance of accuracy and context"},
-            "comprehensive": {"strategies": ["background", "discussions", "academic", "current"], "desc": "Most thorough, includes all sources"},
-            "academic": {"strategies": ["background", "academic"], "desc": "Focus on research and scholarly sources"}
-        }
-        
         with st.expander("ℹ️ What's included?"):
-            info = preset_info[preset_key]
+            info = PRESET_INFO[preset_key]
             st.write(info["desc"])
             if info["strategies"]:
                 st.write("**Enrichment strategies:**")
@@ -110,7 +485,7 @@ def main():
             custom_strategies = st.multiselect(
                 "Custom strategies:",
                 ["background", "discussions", "academic", "current"],
-                default=preset_info[preset_key]["strategies"]
+                default=PRESET_INFO[preset_key]["strategies"]
             )
             
             max_results = st.slider(
@@ -120,14 +495,26 @@ def main():
             
             use_custom = st.checkbox("Use custom config")
         
+        if st.button("🗑️ Clear cache", help="Delete saved video indexes, transcripts and web search results"):
+            from src.rag_pipeline import clear_cache
+            clear_cache()
+            # In-memory entries too, so processing a video again really rebuilds it
+            _build_rag.clear()
+            _summary_store.clear()
+            _cached_all_summaries.clear()
+            _cached_auto_qa.clear()
+            _reset_session()
+            st.toast("✅ Cache cleared")
+            st.rerun()
+        
         # Show current system status
-        if st.session_state.rag_chain:
+        if rag_chain:
             st.markdown("---")
             st.success("✅ System Ready")
-            if st.session_state.metadata:
-                st.write(f"**Video:** {st.session_state.metadata.get('title', 'Unknown')[:50]}...")
+            if metadata:
+                st.write(f"**Video:** {metadata.get('title', 'Unknown')[:50]}...")
                 
-                config = st.session_state.metadata.get('config', {})
+                config = metadata.get('config', {})
                 if config.get('enabled'):
                     st.write(f"**Sources:** {len(config.get('strategies', []))} active")
     
@@ -147,14 +534,9 @@ def main():
         process_button = st.button("🚀 Process Video", type="primary", use_container_width=True)
     
     # Clear button
-    if st.session_state.rag_chain:
+    if rag_chain:
         if st.button("🔄 Clear & Start Over"):
-            st.session_state.rag_chain = None
-            st.session_state.tracker = None
-            st.session_state.metadata = None
-            st.session_state.chat_history = []
-            st.session_state.auto_qa = []
-            st.session_state.summaries = {}
+            _reset_session()
             st.rerun()
     
     # Process video
@@ -166,6 +548,7 @@ def main():
         else:
             # Create config based on selection
             if use_custom:
+                from src.rag_pipeline import EnrichmentConfig
                 config = EnrichmentConfig(
                     enabled=len(custom_strategies) > 0,
                     strategies=custom_strategies,
@@ -173,40 +556,30 @@ def main():
                     track_sources=True
                 )
             else:
-                config_map = {
-                    "transcript_only": EnrichmentConfig.transcript_only(),
-                    "minimal": EnrichmentConfig.preset_minimal(),
-                    "balanced": EnrichmentConfig.preset_balanced(),
-                    "comprehensive": EnrichmentConfig.preset_comprehensive(),
-                    "academic": EnrichmentConfig.preset_academic()
-                }
-                config = config_map[preset_key]
+                config = _preset(preset_key)
             
             # Process with progress
             progress_bar = st.progress(0)
             status_text = st.empty()
             
             try:
-                status_text.text("📥 Step 1/4: Fetching transcript...")
-                progress_bar.progress(25)
+                from src.rag_pipeline import extract_video_id
+                rag_key = (extract_video_id(youtube_url), config.cache_key(), youtube_url)
                 
-                status_text.text("🔍 Step 2/4: Enriching content...")
-                progress_bar.progress(50)
+                # Build in a worker thread and poll the progress it reports
+                progress_state = {'pct': 0, 'stage_name': "📥 Step 1/4: Fetching transcript..."}
+                with ThreadPoolExecutor(max_workers=1) as executor:
+                    future = executor.submit(_build_rag, *rag_key, progress_state)
+                    while not future.done():
+                        progress_bar.progress(progress_state['pct'])
+                        status_text.text(progress_state['stage_name'])
+                        time.sleep(0.15)
+                    rag_chain, tracker, metadata = future.result()
                 
-                # Create RAG system
-                rag_chain, tracker, metadata = create_rag_system(youtube_url, config)
-                
-                status_text.text("🧠 Step 3/4: Creating embeddings...")
-                progress_bar.progress(75)
-                
-                status_text.text("✨ Step 4/4: Building RAG chain...")
-                progress_bar.progress(100)
-                
-                # Store in session
-                st.session_state.rag_chain = rag_chain
-                st.session_state.tracker = tracker
-                st.session_state.metadata = metadata
+                # Keep only the handle in session; the index lives in the resource cache
+                st.session_state.rag_key = rag_key
                 st.session_state.chat_history = []
+                st.session_state.answer_cache.clear()
                 
                 progress_bar.empty()
                 status_text.empty()
@@ -215,19 +588,26 @@ def main():
                 st.success(f"✅ Successfully processed: **{metadata['title']}**")
                 
                 # Show stats
+                summary = _tracker_summary(id(tracker), 0, tracker)
+                sources_by_type = summary['sources_by_type']
+                
+                # Sources are fixed once built, so format the breakdown rows now
+                st.session_state.analytics_rows = tuple(
+                    (source_type.title(), count) for source_type, count in sources_by_type.items()
+                )
+                
                 col1, col2, col3 = st.columns(3)
                 with col1:
-                    st.metric("📊 Sources Tracked", tracker.get_summary()['total_sources'])
+                    st.metric("📊 Sources Tracked", summary['total_sources'])
                 with col2:
-                    sources = tracker.get_summary()['sources_by_type']
-                    st.metric("📚 Source Types", len(sources))
+                    st.metric("📚 Source Types", len(sources_by_type))
                 with col3:
                     enriched = "Yes" if config.enabled else "No"
                     st.metric("🔍 Enrichment", enriched)
                 
                 if config.enabled:
                     with st.expander("📋 View Source Details"):
-                        st.json(tracker.get_summary()['sources_by_type'])
+                        st.json(sources_by_type)
                 
                 st.success("✅ System ready! Use the sections below to generate summaries or ask questions.")
                 
@@ -239,234 +619,18 @@ def main():
                     import traceback
                     st.code(traceback.format_exc())
     
-    # Video Summaries Section (persistent, outside process_button block)
-    if st.session_state.rag_chain:
-        st.markdown("---")
-        st.subheader("📝 Video Summaries")
-        
-        # Summary type selector
-        summary_col1, summary_col2 = st.columns([3, 1])
-        with summary_col1:
-            summary_type = st.selectbox(
-                "Choose summary type:",
-                ["TL;DR (1-2 sentences)", "Brief (2-3 sentences)", 
-                 "Bullet Points", "Detailed", "Comprehensive"],
-                key="summary_type"
-            )
-        with summary_col2:
-            st.write("")
-            st.write("")
-            generate_summary_btn = st.button("📝 Generate", key="gen_summary")
-        
-        # Map display names to internal types
-        summary_type_map = {
-            "TL;DR (1-2 sentences)": "tldr",
-            "Brief (2-3 sentences)": "brief",
-            "Bullet Points": "bullet_points",
-            "Detailed": "detailed",
-            "Comprehensive": "comprehensive"
-        }
-        
-        # Generate summary on button click
-        if generate_summary_btn:
-            selected_type = summary_type_map[summary_type]
-            with st.spinner(f"Generating {summary_type} summary..."):
-                try:
-                    summary = st.session_state.rag_chain.generate_summary(selected_type)
-                    st.session_state.summaries[selected_type] = summary
-                    st.success(f"✅ {summary_type} summary generated!")
-                    st.rerun()
-                except Exception as e:
-                    error_msg = str(e)
-                    if "rate_limit" in error_msg.lower() or "429" in error_msg:
-                        # Extract wait time if available
-                        import re
-                        wait_match = re.search(r'try again in ([\d\.]+[msh]+)', error_msg)
-                        wait_time = wait_match.group(1) if wait_match else "a few minutes"
-                        
-                        st.error(f"⚠️ **Groq API Rate Limit Reached**")
-                        st.warning(f"""
-                        You've used up your daily token limit (100,000 tokens/day).
-                        
-                        **Wait time:** ~{wait_time}
-                        
-                        **Options:**
-                        - ⏰ Wait for the limit to reset
-                        - 💰 Upgrade at [Groq Console](https://console.groq.com/settings/billing)
-                        - 💬 Continue using the chat (uses fewer tokens)
-                        """)
-                    else:
-                        st.error(f"❌ Error: {error_msg}")
-        
-        # Display generated summaries
-        if st.session_state.summaries:
-            st.markdown("### Generated Summaries:")
-            for stype, summary_data in st.session_state.summaries.items():
-                type_display = {
-                    'tldr': '⚡ TL;DR',
-                    'brief': '📄 Brief',
-                    'bullet_points': '📌 Bullet Points',
-                    'detailed': '📖 Detailed',
-                    'comprehensive': '📚 Comprehensive'
-                }
-                
-                with st.expander(f"{type_display.get(stype, stype.title())} Summary", expanded=True):
-                    st.markdown(summary_data['summary'])
-                    st.caption(f"Generated at: {summary_data['generated_at']}")
-        
-        # Option to generate all summaries at once
-        if st.button("📚 Generate All Summary Types", key="gen_all_summaries"):
-            with st.spinner("Generating all summary types... This may take a minute."):
-                try:
-                    all_summaries = st.session_state.rag_chain.generate_all_summaries()
-                    st.session_state.summaries = all_summaries
-                    st.success("✅ All summaries generated!")
-                    st.rerun()
-                except Exception as e:
-                    error_msg = str(e)
-                    if "rate_limit" in error_msg.lower() or "429" in error_msg:
-                        st.error("⚠️ Rate limit reached! Please wait a few minutes and try again.")
-                        st.info("💡 Tip: Generate one summary at a time to conserve tokens.")
-                    else:
-                        st.error(f"❌ Error: {error_msg}")
-        
-        # Auto Q&A Section (Optional)
-        st.markdown("---")
-        st.subheader("🤖 Auto-Generated Q&A")
-        st.caption("⚠️ Note: This feature uses significant API tokens. Use sparingly if near rate limits.")
-        
-        qa_col1, qa_col2 = st.columns([3, 1])
-        with qa_col1:
-            num_questions = st.slider("Number of questions:", 1, 10, 5, key="num_qa")
-        with qa_col2:
-            st.write("")
-            st.write("")
-            generate_qa_btn = st.button("🤖 Generate Q&A", key="gen_qa")
-        
-        # Generate Q&A on button click
-        if generate_qa_btn:
-            with st.spinner(f"Generating {num_questions} questions and answers..."):
-                try:
-                    auto_qa = st.session_state.rag_chain.generate_auto_qa(num_questions=num_questions)
-                    st.session_state.auto_qa = auto_qa
-                    st.rerun()
-                except Exception as e:
-                    if "rate_limit" in str(e).lower():
-                        st.error("⚠️ Rate limit reached! Please wait and try again later.")
-                        st.info("💡 Your daily token limit has been exceeded. Try again in about 30 minutes, or reduce the number of questions.")
-                    else:
-                        st.error(f"Error generating Q&A: {str(e)}")
-        
-        # Display generated Q&A
-        if st.session_state.auto_qa:
-            st.markdown("### Generated Questions & Answers:")
-            for i, qa in enumerate(st.session_state.auto_qa, 1):
-                with st.expander(f"❓ {qa['question']}", expanded=(i==1)):
-                    st.markdown(f"**Answer:** {qa['answer']}")
-                    st.caption(f"Source: AI-generated based on video content")
+    # Video Summaries and Auto Q&A (persistent, outside process_button block)
+    if rag_chain:
+        _summaries_panel(rag_chain)
+        _qa_panel(rag_chain)
     
     # Chat interface
-    if st.session_state.rag_chain:
-        st.markdown("---")
-        st.header("💬 Ask Questions")
-        
-        # Display chat history
-        for i, chat in enumerate(st.session_state.chat_history):
-            with st.container():
-                st.markdown(f"**🤔 You:** {chat['question']}")
-                st.markdown(f"**🤖 Assistant:** {chat['answer']}")
-                if chat.get('sources'):
-                    st.caption(f"📎 Sources: {', '.join(chat['sources'])}")
-                st.markdown("---")
-        
-        # Question input
-        user_question = st.text_input(
-            "Your question:",
-            key="question_input",
-            placeholder="What is this video about?"
-        )
-        
-        col1, col2, col3 = st.columns([1, 1, 4])
-        with col1:
-            ask_button = st.button("Ask", type="primary")
-        with col2:
-            if st.session_state.chat_history:
-                if st.button("Clear Chat"):
-                    st.session_state.chat_history = []
-                    st.rerun()
-        
-        if ask_button and user_question:
-            with st.spinner("🤔 Thinking..."):
-                try:
-                    # Get answer with source tracking
-                    result = st.session_state.rag_chain.invoke_with_sources(user_question)
-                    
-                    # Add to chat history
-                    st.session_state.chat_history.append({
-                        'question': user_question,
-                        'answer': result['answer'],
-                        'sources': list(result['sources_summary']['sources_by_type'].keys()),
-                        'timestamp': datetime.now().isoformat()
-                    })
-                    
-                    st.rerun()
-                    
-                except Exception as e:
-                    st.error(f"❌ Error: {str(e)}")
+    if rag_chain:
+        _chat_panel(rag_chain, tracker, metadata)
     
-    # Analytics section (if system is active)
-    if st.session_state.tracker and st.session_state.chat_history:
-        st.markdown("---")
-        st.header("📊 Analytics")
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            st.subheader("Query Statistics")
-            st.metric("Total Questions", len(st.session_state.chat_history))
-            
-            summary = st.session_state.tracker.get_summary()
-            st.metric("Sources Used", summary['used_sources'])
-            st.metric("Source Types", len(summary['sources_by_type']))
-        
-        with col2:
-            st.subheader("Source Breakdown")
-            sources_by_type = st.session_state.tracker.get_summary()['sources_by_type']
-            
-            for source_type, count in sources_by_type.items():
-                st.write(f"**{source_type.title()}:** {count}")
-        
-        # Export options
-        st.subheader("📥 Export Data")
-        col1, col2, col3 = st.columns(3)
-        
-        with col1:
-            if st.button("Export Source Report (JSON)"):
-                st.session_state.tracker.export_report("source_report.json")
-                st.success("✅ Exported to source_report.json")
-        
-        with col2:
-            if st.button("Export Chat History (JSON)"):
-                with open('chat_history.json', 'w') as f:
-                    json.dump(st.session_state.chat_history, f, indent=2)
-                st.success("✅ Exported to chat_history.json")
-        
-        with col3:
-            if st.button("Export All Data"):
-                # Export everything
-                st.session_state.tracker.export_report("full_report.json")
-                with open('chat_history.json', 'w') as f:
-                    json.dump(st.session_state.chat_history, f, indent=2)
-                st.success("✅ Exported all data!")
-
     # Footer
     st.markdown("---")
-    st.markdown("""
-        <div style='text-align: center; color: #666;'>
-            <p>Built with Streamlit | Powered by Groq & Serper API</p>
-            <p>Week 1-2: Smart Enrichment + Configuration + Source Tracking ✅</p>
-        </div>
-    """, unsafe_allow_html=True)
+    _render_footer()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
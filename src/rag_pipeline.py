@@ -1,19 +1,56 @@
+import logging
 import re
 import json
+import asyncio
+import hashlib
+import pickle
+import shutil
+import tempfile
+import math
+import time
+import numpy as np
+import orjson
+import requests
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import filterfalse
+from operator import attrgetter, itemgetter
 from datetime import datetime
+from functools import lru_cache
 from youtube_transcript_api import YouTubeTranscriptApi
+import faiss
 from langchain_community.vectorstores import FAISS
-from langchain_community.utilities import GoogleSerperAPIWrapper
+from langchain_community.docstore.in_memory import InMemoryDocstore
 from langchain_community.embeddings import FakeEmbeddings
 from langchain_groq import ChatGroq
 from langchain_text_splitters import RecursiveCharacterTextSplitter
+from langchain_core.embeddings import Embeddings
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.output_parsers import StrOutputParser
 from langchain_core.runnables import RunnablePassthrough
-from urllib.parse import urlparse, parse_qs
 import os
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterator, List, Optional, Tuple
 from dataclasses import dataclass, asdict
+from diskcache import Cache
+
+logger = logging.getLogger(__name__)
+
+# ==================== CACHING ====================
+
+CACHE_DIR = os.getenv("RAG_CACHE_DIR", ".cache")
+RAG_CACHE_TTL = 24 * 60 * 60  # Built indexes are reused for one day
+TRANSCRIPT_CACHE_TTL = 7 * 24 * 60 * 60  # Transcripts rarely change
+SEARCH_CACHE_TTL = 24 * 60 * 60  # Web results (incl. "latest" queries) go stale
+
+RAG_CACHE_DIR = os.path.join(CACHE_DIR, "rag")
+_transcript_cache = Cache(os.path.join(CACHE_DIR, "transcripts"))
+_search_cache = Cache(os.path.join(CACHE_DIR, "serper"))
+
+def clear_cache():
+    """Delete persisted indexes, cached transcripts and search results"""
+    shutil.rmtree(RAG_CACHE_DIR, ignore_errors=True)
+    _transcript_cache.clear()
+    _search_cache.clear()
 
 # ==================== CONFIGURATION SYSTEM ====================
 
@@ -32,10 +69,25 @@ class EnrichmentConfig:
     def to_dict(self):
         return asdict(self)
     
+    def cache_key(self) -> tuple:
+        """Hashable key identifying the content this config produces"""
+        return (self.enabled, tuple(self.strategies), self.max_results_per_strategy, self.track_sources)
+    
     @classmethod
     def from_dict(cls, config_dict: dict):
         return cls(**config_dict)
     
+    @classmethod
+    def from_cache_key(cls, key: tuple):
+        """Rebuild a config from the output of cache_key()"""
+        enabled, strategies, max_results, track_sources = key
+        return cls(
+            enabled=enabled,
+            strategies=list(strategies),
+            max_results_per_strategy=max_results,
+            track_sources=track_sources
+        )
+    
     @classmethod
     def preset_minimal(cls):
         """Minimal enrichment - fastest"""
@@ -79,9 +131,29 @@ class SourceContribution:
 class SourceTracker:
     """Track and analyze source contributions"""
     
+    # Bumped on every change to sources; get_summary() memoizes against it
+    _version = 0
+    _summary_memo: Optional[tuple] = None
+    
+    # A cached tracker is shared by every session asking about its video, so
+    # only the most recent queries are kept
+    MAX_QUERY_HISTORY = 200
+    
     def __init__(self):
         self.sources: List[SourceContribution] = []
-        self.query_history: List[Dict] = []
+        self.query_history: deque = deque(maxlen=self.MAX_QUERY_HISTORY)
+        # Maintained incrementally so neither marking nor summarizing rescans sources
+        self._by_type: Counter = Counter()
+        self._used_types: set = set()
+    
+    def __setstate__(self, state):
+        """Rebuild the incremental indexes for trackers pickled before they existed"""
+        self.__dict__.update(state)
+        if '_by_type' not in state:
+            self._by_type = Counter(s.source_type for s in self.sources)
+            self._used_types = {s.source_type for s in self.sources if s.used_in_context}
+        if not isinstance(self.query_history, deque):
+            self.query_history = deque(self.query_history, maxlen=self.MAX_QUERY_HISTORY)
     
     def add_source(self, source_type: str, content: str, relevance: float = 0.0):
         """Add a source to tracking"""
@@ -92,28 +164,33 @@ class SourceTracker:
             relevance_score=relevance
         )
         self.sources.append(source)
+        self._by_type[source_type] += 1
+        self._version += 1
     
     def mark_used(self, source_type: str):
         """Mark a source type as used in context"""
-        for source in self.sources:
-            if source.source_type == source_type:
-                source.used_in_context = True
+        if source_type not in self._used_types:
+            self._used_types.add(source_type)
+            self._version += 1
     
     def get_summary(self) -> Dict:
-        """Get summary of source usage"""
-        total = len(self.sources)
-        used = sum(1 for s in self.sources if s.used_in_context)
+        """Get summary of source usage (memoized until sources change)"""
+        if self._summary_memo is not None and self._summary_memo[0] == self._version:
+            return self._summary_memo[1]
         
-        by_type = {}
+        # Per-source flags are only needed for the report, so set them here
         for source in self.sources:
-            by_type[source.source_type] = by_type.get(source.source_type, 0) + 1
+            source.used_in_context = source.source_type in self._used_types
         
-        return {
-            'total_sources': total,
-            'used_sources': used,
-            'sources_by_type': by_type,
-            'sources': [asdict(s) for s in self.sources]
+        summary = {
+            'total_sources': len(self.sources),
+            'used_sources': sum(self._by_type[t] for t in self._used_types),
+            'sources_by_type': dict(self._by_type),
+            # Dataclasses as-is: orjson serializes them natively, no asdict() copies
+            'sources': list(self.sources)
         }
+        self._summary_memo = (self._version, summary)
+        return summary
     
     def log_query(self, question: str, answer: str, sources_used: List[str]):
         """Log a query and its sources"""
@@ -124,58 +201,85 @@ class SourceTracker:
             'sources_used': sources_used
         })
     
-    def export_report(self, filepath: str = "source_tracking_report.json"):
-        """Export tracking data to JSON"""
-        report = {
+    def get_report(self) -> Dict:
+        """Get full tracking report"""
+        return {
             'summary': self.get_summary(),
-            'query_history': self.query_history,
+            'query_history': list(self.query_history),
             'generated_at': datetime.now().isoformat()
         }
+    
+    def to_bytes(self) -> bytes:
+        """Serialize tracking report to JSON bytes (no file I/O)"""
+        return orjson.dumps(self.get_report(), option=orjson.OPT_INDENT_2)
+    
+    def export_report(self, filepath: str = "source_tracking_report.json"):
+        """Export tracking data to JSON"""
+        with open(filepath, 'wb') as f:
+            f.write(self.to_bytes())
         
-        with open(filepath, 'w') as f:
-            json.dump(report, f, indent=2)
-        
-        print(f"✓ Source tracking report saved to: {filepath}")
+        logger.info("✓ Source tracking report saved to: %s", filepath)
         return filepath
 
 # ==================== CORE FUNCTIONS ====================
 
+def report_progress(progress_state: Optional[Dict], pct: int, stage_name: str):
+    """Update a caller-supplied progress dict (no-op when none was given)"""
+    if progress_state is not None:
+        progress_state['pct'] = pct
+        progress_state['stage_name'] = stage_name
+
+# youtu.be/ID, youtube.com/watch?...v=ID, /embed/ID and /shorts/ID in one pass
+_YT_ID_RE = re.compile(
+    r'(?:youtu\.be/|youtube\.com/(?:watch\?(?:[^&#]*&)*v=|embed/|shorts/))([A-Za-z0-9_-]{11})'
+)
+
 def extract_video_id(url: str):
     """Extract video ID from various YouTube URL formats"""
-    try:
-        if "youtu.be/" in url:
-            return url.split("youtu.be/")[1].split("?")[0].split("&")[0]
-        elif "youtube.com/watch" in url:
-            parsed = urlparse(url)
-            video_id = parse_qs(parsed.query).get('v')
-            if video_id:
-                return video_id[0]
-        elif "youtube.com/embed/" in url:
-            return url.split("youtube.com/embed/")[1].split("?")[0]
-        raise ValueError("Could not extract video ID from URL")
-    except Exception as e:
-        raise ValueError(f"Invalid YouTube URL format: {str(e)}")
+    match = _YT_ID_RE.search(url)
+    if not match:
+        raise ValueError("Invalid YouTube URL format: Could not extract video ID from URL")
+    return match.group(1)
 
 def extract_text_from_transcript(transcript_obj):
-    """Extract text from FetchedTranscript object"""
-    if hasattr(transcript_obj, 'snippets'):
-        snippets = transcript_obj.snippets
-        if isinstance(snippets, list) and len(snippets) > 0:
-            texts = [snippet.text for snippet in snippets if hasattr(snippet, 'text')]
-            if texts:
-                return " ".join(texts)
+    """Extract text from a FetchedTranscript (or a list of raw snippet dicts)"""
+    snippets = getattr(transcript_obj, 'snippets', transcript_obj)
+    if not isinstance(snippets, list):
+        try:
+            snippets = list(snippets)
+        except TypeError:
+            return str(transcript_obj)
     
-    try:
-        texts = [item.text for item in transcript_obj if hasattr(item, 'text')]
-        if texts:
-            return " ".join(texts)
-    except:
-        pass
+    if snippets:
+        # Raw/legacy transcripts are dicts, FetchedTranscript snippets are objects
+        getter = itemgetter('text') if isinstance(snippets[0], dict) else attrgetter('text')
+        try:
+            # map() with a C getter: no Python frame per snippet
+            return " ".join(map(getter, snippets))
+        except (KeyError, AttributeError):
+            pass
     
     return str(transcript_obj)
 
+@lru_cache(maxsize=256)
+def _oembed_title(video_id: str) -> str:
+    """Title from YouTube's oEmbed endpoint (raises on failure, so failures aren't cached)"""
+    response = requests.get(
+        "https://www.youtube.com/oembed",
+        params={"url": f"https://www.youtube.com/watch?v={video_id}", "format": "json"},
+        timeout=5
+    )
+    response.raise_for_status()
+    return response.json()["title"]
+
 def get_video_title_from_youtube(video_id: str):
-    """Get video title directly from YouTube using yt-dlp"""
+    """Get video title from YouTube (oEmbed, falling back to yt-dlp)"""
+    # oEmbed is one small JSON request; yt-dlp parses the whole player page
+    try:
+        return _oembed_title(video_id)
+    except Exception as e:
+        logger.warning("oEmbed title lookup failed, trying yt-dlp: %s", e)
+    
     try:
         import yt_dlp
         ydl_opts = {
@@ -187,28 +291,70 @@ def get_video_title_from_youtube(video_id: str):
             info = ydl.extract_info(f"https://www.youtube.com/watch?v={video_id}", download=False)
             return info.get('title', f"YouTube Video {video_id}")
     except Exception as e:
-        print(f"Could not fetch title from YouTube: {e}")
+        logger.warning("Could not fetch title from YouTube: %s", e)
         return f"YouTube Video {video_id}"
 
+# Words of 4+ letters; shorter ones are never topics
+_WORD_RE = re.compile(r'\b[a-zA-Z]{4,}\b')
+
+_COMMON_WORDS = frozenset({
+    'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
+    'of', 'with', 'by', 'from', 'as', 'is', 'was', 'are', 'were', 'been',
+    'be', 'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would',
+    'could', 'should', 'may', 'might', 'can', 'this', 'that', 'these',
+    'those', 'i', 'you', 'he', 'she', 'it', 'we', 'they', 'what', 'which',
+    'who', 'when', 'where', 'why', 'how', 'so', 'than', 'too', 'very',
+    'just', 'now', 'get', 'got', 'like', 'know', 'think', 'going', 'want'
+})
+
 def extract_key_topics(transcript: str, max_topics: int = 3) -> List[str]:
     """Extract key topics from transcript using keyword frequency"""
-    common_words = {'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 
-                   'of', 'with', 'by', 'from', 'as', 'is', 'was', 'are', 'were', 'been',
-                   'be', 'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would',
-                   'could', 'should', 'may', 'might', 'can', 'this', 'that', 'these',
-                   'those', 'i', 'you', 'he', 'she', 'it', 'we', 'they', 'what', 'which',
-                   'who', 'when', 'where', 'why', 'how', 'so', 'than', 'too', 'very',
-                   'just', 'now', 'get', 'got', 'like', 'know', 'think', 'going', 'want'}
-    
-    words = re.findall(r'\b[a-zA-Z]{4,}\b', transcript.lower())
+    words = _WORD_RE.findall(transcript.lower())
+    # filterfalse + Counter keep the per-word loop in C (no generator frame)
+    counts = Counter(filterfalse(_COMMON_WORDS.__contains__, words))
+    return [word for word, _ in counts.most_common(max_topics)]
+
+# Language codes preferred when picking a transcript
+_ENGLISH_CODES = frozenset({'en', 'en-US', 'en-GB'})
+
+@_transcript_cache.memoize(expire=TRANSCRIPT_CACHE_TTL)
+def fetch_transcript(video_id: str) -> str:
+    """
+    Fetch transcript text for a video, preferring English
+    Lists the available transcripts once and fetches the chosen one, rather
+    than trying fetch() per language (each of which lists again internally).
+    Results are cached on disk by video ID, so switching presets on the
+    same video doesn't hit YouTube again
+    """
+    try:
+        logger.debug("Listing available transcripts...")
+        # TranscriptList is iterable but doesn't have len(); manual
+        # transcripts come before auto-generated ones
+        available_transcripts = list(YouTubeTranscriptApi().list(video_id))
+        if not available_transcripts:
+            raise Exception("No transcripts available for this video")
+        
+        # English if there is one, otherwise the first available
+        preferred_transcript = next(
+            (t for t in available_transcripts if getattr(t, 'language_code', None) in _ENGLISH_CODES),
+            available_transcripts[0]
+        )
+        
+        full_transcript = extract_text_from_transcript(preferred_transcript.fetch())
+        language = getattr(preferred_transcript, 'language_code', 'unknown')
+        logger.info("✓ Successfully fetched transcript in language: %s", language)
+        
+    except Exception as e:
+        raise Exception(
+            f"Failed to fetch transcript for video {video_id}: {e}\n"
+            f"The video may not have any transcripts available."
+        )
     
-    word_freq = {}
-    for word in words:
-        if word not in common_words:
-            word_freq[word] = word_freq.get(word, 0) + 1
+    # Validate transcript content (raising also keeps empty results out of the cache)
+    if not full_transcript or not full_transcript.strip():
+        raise Exception("Transcript was fetched but contains no text content")
     
-    sorted_words = sorted(word_freq.items(), key=lambda x: x[1], reverse=True)
-    return [word for word, freq in sorted_words[:max_topics]]
+    return full_transcript
 
 # ==================== CONTENT ENRICHER ====================
 
@@ -223,23 +369,33 @@ class ContentEnricher:
         
         if self.config.enabled and self.serper_api_key:
             try:
+                # Imported here so transcript-only runs never load the Serper client
+                from langchain_community.utilities import GoogleSerperAPIWrapper
                 os.environ["SERPER_API_KEY"] = self.serper_api_key
                 self.search = GoogleSerperAPIWrapper()
-                print("✓ Serper API initialized")
+                logger.info("✓ Serper API initialized")
             except Exception as e:
-                print(f"⚠ Serper API initialization failed: {e}")
+                logger.warning("⚠ Serper API initialization failed: %s", e)
                 self.search = None
         else:
             if self.config.enabled and not self.serper_api_key:
-                print("⚠ SERPER_API_KEY not found - web enrichment disabled")
+                logger.warning("⚠ SERPER_API_KEY not found - web enrichment disabled")
     
-    def _safe_search(self, query: str, source_type: str) -> str:
-        """Perform safe search with tracking"""
+    async def _safe_search(self, query: str, source_type: str) -> str:
+        """Perform safe search with tracking (results cached for a day)"""
         if not self.search:
             return ""
         
         try:
-            results = self.search.run(query)
+            # Shared topics recur across videos and presets, so raw results
+            # are cached on disk by query
+            cache_key = hashlib.blake2b(query.encode()).hexdigest()
+            results = _search_cache.get(cache_key)
+            if results is None:
+                results = await self.search.arun(query)
+                if results:
+                    _search_cache.set(cache_key, results, expire=SEARCH_CACHE_TTL)
+            
             truncated = results[:self.config.max_results_per_strategy] if results else ""
             
             # Track this source
@@ -248,68 +404,76 @@ class ContentEnricher:
             
             return truncated
         except Exception as e:
-            print(f"  ✗ Search failed for '{query}': {e}")
+            logger.warning("✗ Search failed for '%s': %s", query, e)
             return ""
     
-    def get_background_context(self, video_title: str, key_topics: List[str]) -> str:
+    async def get_background_context(self, video_title: str, key_topics: List[str]) -> str:
         """Strategy 1: Get background information on key topics"""
         if not self.search or 'background' not in self.config.strategies:
             return ""
         
-        print("  → [BACKGROUND] Fetching topic context...")
-        context_parts = []
+        logger.debug("→ [BACKGROUND] Fetching topic context...")
+        topics = key_topics[:2]
+        results = await asyncio.gather(
+            *(self._safe_search(f"{topic} overview explanation", "background") for topic in topics)
+        )
         
-        for topic in key_topics[:2]:
-            result = self._safe_search(f"{topic} overview explanation", "background")
-            if result:
-                context_parts.append(f"Background on '{topic}':\n{result}")
+        context_parts = [
+            f"Background on '{topic}':\n{result}"
+            for topic, result in zip(topics, results) if result
+        ]
         
         return "\n\n".join(context_parts)
     
-    def get_related_discussions(self, video_title: str) -> str:
+    async def get_related_discussions(self, video_title: str) -> str:
         """Strategy 2: Find related discussions and analyses"""
         if not self.search or 'discussions' not in self.config.strategies:
             return ""
         
-        print("  → [DISCUSSIONS] Searching for related content...")
+        logger.debug("→ [DISCUSSIONS] Searching for related content...")
         query = f'"{video_title}" discussion analysis review'
-        return self._safe_search(query, "discussions")
+        return await self._safe_search(query, "discussions")
     
-    def get_academic_context(self, video_title: str, key_topics: List[str]) -> str:
+    async def get_academic_context(self, video_title: str, key_topics: List[str]) -> str:
         """Strategy 3: Search for academic or research context"""
         if not self.search or 'academic' not in self.config.strategies:
             return ""
         
-        print("  → [ACADEMIC] Searching for research sources...")
+        logger.debug("→ [ACADEMIC] Searching for research sources...")
         main_topic = key_topics[0] if key_topics else video_title
         query = f"{main_topic} research paper study academic"
-        return self._safe_search(query, "academic")
+        return await self._safe_search(query, "academic")
     
-    def get_current_info(self, video_title: str, key_topics: List[str]) -> str:
+    async def get_current_info(self, video_title: str, key_topics: List[str]) -> str:
         """Strategy 4: Get current/recent information on topics"""
         if not self.search or 'current' not in self.config.strategies:
             return ""
         
-        print("  → [CURRENT] Fetching latest information...")
+        logger.debug("→ [CURRENT] Fetching latest information...")
         main_topic = key_topics[0] if key_topics else video_title
         query = f"{main_topic} latest 2025 updates news"
-        return self._safe_search(query, "current")
+        return await self._safe_search(query, "current")
     
     def enrich(self, video_title: str, transcript: str) -> Dict[str, str]:
         """Apply all configured enrichment strategies"""
         if not self.config.enabled or not self.search:
-            print("Enrichment disabled or API unavailable")
+            logger.info("Enrichment disabled or API unavailable")
             return {}
         
-        print(f"\n🔍 Enriching content with strategies: {self.config.strategies}")
+        logger.info("🔍 Enriching content with strategies: %s", self.config.strategies)
         
         # Extract key topics
         key_topics = extract_key_topics(transcript)
-        print(f"  Key topics identified: {', '.join(key_topics)}")
+        logger.info("Key topics identified: %s", ', '.join(key_topics))
         
-        enriched_data = {}
+        # Searches are independent, so run them concurrently
+        enriched_data = asyncio.run(self._enrich_async(video_title, key_topics))
         
-        # Apply each strategy
+        logger.info("✓ Enrichment complete (%s sources added)", len(enriched_data))
+        return enriched_data
+    
+    async def _enrich_async(self, video_title: str, key_topics: List[str]) -> Dict[str, str]:
+        """Run all configured strategies concurrently"""
         strategy_map = {
             'background': lambda: self.get_background_context(video_title, key_topics),
             'discussions': lambda: self.get_related_discussions(video_title),
@@ -317,13 +481,26 @@ class ContentEnricher:
             'current': lambda: self.get_current_info(video_title, key_topics)
         }
         
-        for strategy in self.config.strategies:
-            if strategy in strategy_map:
-                result = strategy_map[strategy]()
-                if result:
-                    enriched_data[strategy] = result
+        strategies = [s for s in self.config.strategies if s in strategy_map]
+        
+        # One pooled HTTP session for every Serper request in this run;
+        # without it the wrapper opens a new session per query
+        import aiohttp
+        async with aiohttp.ClientSession() as session:
+            self.search.aiosession = session
+            try:
+                results = await asyncio.gather(
+                    *(strategy_map[s]() for s in strategies), return_exceptions=True
+                )
+            finally:
+                self.search.aiosession = None
         
-        print(f"✓ Enrichment complete ({len(enriched_data)} sources added)\n")
+        enriched_data = {}
+        for strategy, result in zip(strategies, results):
+            if isinstance(result, Exception):
+                logger.warning("✗ Strategy '%s' failed: %s", strategy, result)
+            elif result:
+                enriched_data[strategy] = result
         return enriched_data
     
     def get_tracker(self) -> SourceTracker:
@@ -333,9 +510,11 @@ class ContentEnricher:
 # ==================== DOCUMENT LOADING ====================
 
 def load_and_enrich_documents(url: str, config: Optional[EnrichmentConfig] = None, 
-                              source_tracker: Optional[SourceTracker] = None) -> Tuple[List[str], Dict, SourceTracker]:
+                              source_tracker: Optional[SourceTracker] = None,
+                              progress_state: Optional[Dict] = None) -> Tuple[List[str], Dict, SourceTracker]:
     """
     Load transcript and enrich with configured strategies
+    Progress is reported into progress_state, if given
     Returns:
         - documents: List of enriched content
         - metadata: Video and enrichment metadata
@@ -349,89 +528,25 @@ def load_and_enrich_documents(url: str, config: Optional[EnrichmentConfig] = Non
     
     try:
         video_id = extract_video_id(url)
-        print(f"Extracted video ID: {video_id}")
+        logger.info("Extracted video ID: %s", video_id)
+        report_progress(progress_state, 0, "📥 Step 1/4: Fetching transcript...")
         
-        api = YouTubeTranscriptApi()
-        transcript_obj = None
-        full_transcript = None
-        
-        # Try to fetch transcript with multiple fallback strategies
-        try:
-            # Strategy 1: Try English transcript
-            print("Attempting to fetch English transcript...")
-            transcript_obj = api.fetch(video_id, languages=['en'])
-            full_transcript = extract_text_from_transcript(transcript_obj)
-            print(f"✓ Successfully fetched English transcript")
+        # The title doesn't depend on the transcript, so look it up meanwhile
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            title_future = executor.submit(get_video_title_from_youtube, video_id)
             
-        except Exception as e1:
-            print(f"English transcript not available: {e1}")
+            full_transcript = fetch_transcript(video_id)
+            logger.info("Successfully extracted transcript (%s characters)", len(full_transcript))
             
-            try:
-                # Strategy 2: Try fetching any available transcript
-                print("Attempting to fetch any available transcript...")
-                transcript_obj = api.fetch(video_id)
-                full_transcript = extract_text_from_transcript(transcript_obj)
-                print(f"✓ Successfully fetched default transcript")
-                
-            except Exception as e2:
-                print(f"Default transcript fetch failed: {e2}")
-                
-                try:
-                    # Strategy 3: List all available transcripts and get the first one
-                    print("Attempting to list and fetch first available transcript...")
-                    transcript_list = api.list(video_id)
-                    
-                    # TranscriptList is iterable but doesn't have len()
-                    # Try to get the first available transcript
-                    available_transcripts = list(transcript_list)
-                    
-                    if not available_transcripts:
-                        raise Exception("No transcripts available for this video")
-                    
-                    # Try to find English or auto-generated transcript first
-                    preferred_transcript = None
-                    for transcript in available_transcripts:
-                        if hasattr(transcript, 'language_code'):
-                            if transcript.language_code in ['en', 'en-US', 'en-GB']:
-                                preferred_transcript = transcript
-                                break
-                    
-                    # If no English found, use first available
-                    if preferred_transcript is None:
-                        preferred_transcript = available_transcripts[0]
-                    
-                    # Fetch the selected transcript
-                    transcript_obj = preferred_transcript.fetch()
-                    full_transcript = extract_text_from_transcript(transcript_obj)
-                    
-                    language = getattr(preferred_transcript, 'language_code', 'unknown')
-                    print(f"✓ Successfully fetched transcript in language: {language}")
-                    
-                except Exception as e3:
-                    error_msg = (
-                        f"Failed to fetch transcript for video {video_id}. "
-                        f"Errors encountered:\n"
-                        f"1. English transcript: {str(e1)}\n"
-                        f"2. Default transcript: {str(e2)}\n"
-                        f"3. List transcripts: {str(e3)}\n"
-                        f"The video may not have any transcripts available."
-                    )
-                    raise Exception(error_msg)
-        
-        # Validate transcript content
-        if not full_transcript or not full_transcript.strip():
-            raise Exception("Transcript was fetched but contains no text content")
-        
-        print(f"Successfully extracted transcript ({len(full_transcript)} characters)")
+            video_title = title_future.result()
+            logger.info("Video title: %s", video_title)
+        
+        report_progress(progress_state, 25, "🔍 Step 2/4: Enriching content...")
         
         # Track transcript as primary source
         source_tracker.add_source('transcript', full_transcript, relevance=1.0)
         source_tracker.mark_used('transcript')
         
-        # Get video title
-        video_title = get_video_title_from_youtube(video_id)
-        print(f"Video title: {video_title}")
-        
         metadata = {
             'title': video_title,
             'video_id': video_id,
@@ -454,7 +569,7 @@ def load_and_enrich_documents(url: str, config: Optional[EnrichmentConfig] = Non
             
             metadata['enrichment_sources'] = list(enriched_data.keys())
         else:
-            print("Using transcript only (enrichment disabled)")
+            logger.info("Using transcript only (enrichment disabled)")
             metadata['enrichment_sources'] = []
         
         enriched_content = "\n".join(content_parts)
@@ -465,44 +580,186 @@ def load_and_enrich_documents(url: str, config: Optional[EnrichmentConfig] = Non
         raise Exception(f"Failed to load and process video: {str(e)}")
 # ==================== VECTOR STORE ====================
 
-def create_vector_store(documents: list):
-    """Create FAISS vector store with metadata"""
-    text_splitter = RecursiveCharacterTextSplitter(
-        chunk_size=1500,
-        chunk_overlap=300,
-        separators=["\n\n", "\n", ". ", " ", ""]
-    )
+EMBEDDING_MODEL = "sentence-transformers/all-MiniLM-L6-v2"
+
+# Embedding backends by model name; loading the model takes seconds and a
+# copy of its weights, so every RAG system in the process shares one
+_EMBEDDINGS_CACHE: Dict[str, object] = {}
+
+class QueryCachedEmbeddings(Embeddings):
+    """
+    Embeddings wrapper that memoizes embed_query
+    Each question is embedded by both the semantic answer cache and the
+    retriever, and repeat questions recur; documents pass straight through
+    """
+    
+    def __init__(self, inner: Embeddings, maxsize: int = 1024):
+        self.inner = inner
+        # Tuples, so callers can't mutate a cached vector
+        self._embed_query = lru_cache(maxsize=maxsize)(lambda text: tuple(inner.embed_query(text)))
     
-    text_chunks = text_splitter.create_documents(documents)
-    print(f"Created {len(text_chunks)} text chunks")
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        return self.inner.embed_documents(texts)
+    
+    def embed_query(self, text: str) -> List[float]:
+        return list(self._embed_query(text))
+
+def _embedding_device() -> str:
+    """Run the embedding model on the GPU when torch can see one"""
+    try:
+        import torch
+        return 'cuda' if torch.cuda.is_available() else 'cpu'
+    except ImportError:
+        return 'cpu'
+
+def get_embeddings(model_name: str = EMBEDDING_MODEL):
+    """Get the best available embeddings backend (built once per model name)"""
+    if model_name in _EMBEDDINGS_CACHE:
+        return _EMBEDDINGS_CACHE[model_name]
     
     embeddings = None
     
     try:
         from langchain_huggingface import HuggingFaceEmbeddings
-        print("Using HuggingFace embeddings (local)...")
+        logger.info("Using HuggingFace embeddings (local)...")
+        device = _embedding_device()
+        model_kwargs = {'device': device}
+        if device == 'cuda':
+            # FP16 weights on GPU: half the memory traffic, tensor-core matmuls
+            import torch
+            model_kwargs['model_kwargs'] = {'torch_dtype': torch.float16}
+        
+        # embed_documents() hands the whole chunk list to a single
+        # SentenceTransformer.encode() call, which batches internally
         embeddings = HuggingFaceEmbeddings(
-            model_name="sentence-transformers/all-MiniLM-L6-v2"
+            model_name=model_name,
+            model_kwargs=model_kwargs,
+            encode_kwargs={
+                'normalize_embeddings': True,
+                'batch_size': 128 if device == 'cuda' else 64
+            }
         )
     except ImportError:
-        print("HuggingFace not available, trying alternatives...")
+        logger.warning("HuggingFace not available, trying alternatives...")
         
         try:
             from langchain_community.embeddings import OllamaEmbeddings
-            print("Using Ollama embeddings (local)...")
+            logger.info("Using Ollama embeddings (local)...")
             embeddings = OllamaEmbeddings(model="llama2")
         except:
-            print("Using simple embeddings (fast but basic)...")
+            logger.info("Using simple embeddings (fast but basic)...")
             embeddings = FakeEmbeddings(size=384)
     
-    print("Creating vector store...")
-    vector_store = FAISS.from_documents(text_chunks, embeddings)
-    print("✓ Vector store created")
+    embeddings = QueryCachedEmbeddings(embeddings)
+    _EMBEDDINGS_CACHE[model_name] = embeddings
+    return embeddings
+
+# Chunking is configurable without code changes; the splitter is stateless,
+# so one instance serves every build
+CHUNK_SIZE = int(os.getenv("RAG_CHUNK_SIZE", "1500"))
+CHUNK_OVERLAP = int(os.getenv("RAG_CHUNK_OVERLAP", "300"))
+
+_SPLITTER = RecursiveCharacterTextSplitter(
+    chunk_size=CHUNK_SIZE,
+    chunk_overlap=CHUNK_OVERLAP,
+    separators=["\n\n", "\n", ". ", " ", ""],
+    add_start_index=True
+)
+
+# HNSW graph parameters: neighbours per node, build-time and query-time beam width
+HNSW_M = 32
+HNSW_EF_CONSTRUCTION = 200
+HNSW_EF_SEARCH = 64
+
+# From this many chunks up, vectors are product-quantized (IVFPQ) to cut
+# memory: m sub-quantizers of IVFPQ_NBITS each, nprobe lists scanned per
+# query. A 6-bit PQ codebook has 64 centroids and faiss wants ~39 training
+# points per centroid (2496), so the threshold sits just above that
+IVFPQ_MIN_CHUNKS = 2500
+IVFPQ_M = 48
+IVFPQ_NBITS = 6
+IVFPQ_NPROBE = 16
+
+# Store HNSW vectors as 8-bit scalar codes (4x smaller) instead of float32
+QUANTIZE_INDEX = os.getenv("RAG_QUANTIZE_INDEX", "0") == "1"
+
+def create_vector_store(documents: list, quantize: bool = QUANTIZE_INDEX):
+    """
+    Create FAISS vector store with metadata
+    With quantize, the HNSW index keeps 8-bit codes rather than float32 vectors
+    """
+    # Record where each chunk came from, so retrieved context can be put
+    # back in a stable order (see format_docs)
+    text_chunks = _SPLITTER.create_documents(
+        documents, metadatas=[{'doc_index': i} for i in range(len(documents))]
+    )
+    logger.info("Created %s text chunks", len(text_chunks))
+    
+    embeddings = get_embeddings()
+    
+    logger.info("Creating vector store...")
+    texts = [chunk.page_content for chunk in text_chunks]
+    xb = np.asarray(embeddings.embed_documents(texts), dtype=np.float32)
+    n, dim = xb.shape
+    
+    if n >= IVFPQ_MIN_CHUNKS:
+        # Long videos: store PQ codes instead of raw float32 vectors
+        m = next(m for m in range(IVFPQ_M, 0, -1) if dim % m == 0)
+        quantizer = faiss.IndexFlatL2(dim)
+        # 4*sqrt(n) lists, capped so each coarse centroid gets ~39 training points
+        nlist = min(int(4 * math.sqrt(n)), n // 39)
+        index = faiss.IndexIVFPQ(quantizer, dim, nlist, m, IVFPQ_NBITS)
+        index.train(xb)
+        index.nprobe = IVFPQ_NPROBE
+        logger.info("Using IVFPQ index for %s chunks", n)
+    else:
+        # HNSW graph instead of the default flat index, so each query walks
+        # the graph rather than scanning every chunk
+        if quantize:
+            index = faiss.IndexHNSWSQ(dim, faiss.ScalarQuantizer.QT_8bit, HNSW_M)
+            index.train(xb)  # learns the per-dimension ranges for the 8-bit codes
+        else:
+            index = faiss.IndexHNSWFlat(dim, HNSW_M)
+        index.hnsw.efConstruction = HNSW_EF_CONSTRUCTION
+    
+    vector_store = FAISS(
+        embedding_function=embeddings,
+        index=index,
+        docstore=InMemoryDocstore(),
+        index_to_docstore_id={}
+    )
+    # Vectors are already computed, so add them directly rather than re-embedding
+    vector_store.add_embeddings(
+        zip(texts, xb.tolist()),
+        metadatas=[chunk.metadata for chunk in text_chunks]
+    )
+    if isinstance(index, faiss.IndexHNSW):
+        index.hnsw.efSearch = HNSW_EF_SEARCH
+    logger.info("✓ Vector store created")
     
     return vector_store
 
 # ==================== RAG CHAIN WITH SOURCE TRACKING ====================
 
+# Semantic answer cache: questions at or above this cosine similarity to an
+# answered one reuse its answer; oldest entries are evicted past the size
+SEMANTIC_CACHE_THRESHOLD = 0.95
+SEMANTIC_CACHE_SIZE = 256
+
+# Groq model that last constructed successfully, tried first on later builds
+_groq_model: Optional[str] = None
+
+def format_docs(docs) -> str:
+    """
+    Join retrieved chunks in document order rather than similarity order
+    
+    The same set of chunks then always produces the same context text,
+    which keeps the prompt prefix identical across questions and lets the
+    provider's prompt cache reuse it
+    """
+    ordered = sorted(docs, key=lambda d: (d.metadata.get('doc_index', 0), d.metadata.get('start_index', 0)))
+    return "\n\n".join(doc.page_content for doc in ordered)
+
 class TrackedRAGChain:
     """RAG chain with source tracking capabilities"""
     
@@ -511,6 +768,7 @@ class TrackedRAGChain:
         self.metadata = metadata
         self.tracker = source_tracker
         self.llm = None  # Store LLM instance
+        self._qa_cache = deque(maxlen=SEMANTIC_CACHE_SIZE)  # (question vector, answer), FIFO
         self.chain = self._create_chain()
     
     def _create_chain(self):
@@ -518,7 +776,9 @@ class TrackedRAGChain:
         if not os.getenv("GROQ_API_KEY"):
             raise Exception("GROQ_API_KEY not found!")
         
-        print("Using Groq LLM (free & fast)")
+        logger.info("Using Groq LLM (free & fast)")
+        
+        global _groq_model
         
         models_to_try = [
             "llama-3.3-70b-versatile",
@@ -526,6 +786,10 @@ class TrackedRAGChain:
             "mixtral-8x7b-32768",
             "gemma2-9b-it"
         ]
+        # Start from the model that worked last time in this process
+        if _groq_model:
+            models_to_try.remove(_groq_model)
+            models_to_try.insert(0, _groq_model)
         
         llm = None
         for model in models_to_try:
@@ -535,10 +799,11 @@ class TrackedRAGChain:
                     temperature=0,
                     groq_api_key=os.getenv("GROQ_API_KEY")
                 )
-                print(f"Using model: {model}")
+                _groq_model = model
+                logger.info("Using model: %s", model)
                 break
             except Exception as e:
-                print(f"Model {model} not available: {e}")
+                logger.warning("Model %s not available: %s", model, e)
                 continue
         
         if not llm:
@@ -558,6 +823,8 @@ class TrackedRAGChain:
             if strategies:
                 enrichment_note = f"\n\nNOTE: Context includes video transcript + web enrichment ({strategies})."
         
+        # Instructions and context first, question last: everything before
+        # the question is shared by repeat queries hitting the same chunks
         prompt_template = f"""You are an expert assistant analyzing YouTube video content.
 
 SOURCES IN CONTEXT:
@@ -582,26 +849,86 @@ ANSWER:"""
         prompt = ChatPromptTemplate.from_template(prompt_template)
         
         return (
-            {"context": retriever, "question": RunnablePassthrough()}
+            {"context": retriever | format_docs, "question": RunnablePassthrough()}
             | prompt
             | self.llm
             | StrOutputParser()
         )
     
-    def invoke(self, question: str) -> str:
-        """Invoke the chain and track sources"""
-        answer = self.chain.invoke(question)
-        
-        # Identify which sources were likely used
+    @property
+    def embedder(self):
+        """Embeddings model behind this chain's vector store"""
+        return self.vector_store.embeddings
+    
+    def _sources_used(self) -> List[str]:
+        """Identify which sources were likely used"""
         sources_used = ['transcript']  # Always uses transcript
         if self.metadata.get('enrichment_sources'):
             sources_used.extend(self.metadata['enrichment_sources'])
+        return sources_used
+    
+    def _question_vector(self, question: str) -> np.ndarray:
+        """L2-normalized question embedding from the store's own embedder"""
+        vector = np.asarray(self.embedder.embed_query(question), dtype=np.float32)
+        return vector / (np.linalg.norm(vector) or 1.0)
+    
+    def _semantic_lookup(self, vector: np.ndarray) -> Optional[str]:
+        """Cached answer to an earlier question close enough to this one"""
+        # The chain is shared across Streamlit sessions (one thread each), so
+        # work on a snapshot: another session may append while we compare
+        entries = list(self._qa_cache)
+        if not entries:
+            return None
+        scores = np.stack([cached_vector for cached_vector, _ in entries]) @ vector
+        best = int(np.argmax(scores))
+        return entries[best][1] if scores[best] >= SEMANTIC_CACHE_THRESHOLD else None
+    
+    def invoke(self, question: str, use_cache: bool = True) -> str:
+        """
+        Invoke the chain and track sources
+        Paraphrases of an already answered question are served from the
+        semantic cache; generated prompts pass use_cache=False, since
+        near-identical prompt templates can still ask for different output
+        """
+        vector = self._question_vector(question) if use_cache else None
+        answer = self._semantic_lookup(vector) if use_cache else None
+        
+        if answer is None:
+            answer = self.chain.invoke(question)
+            if use_cache:
+                self._qa_cache.append((vector, answer))
         
         # Log the query
-        self.tracker.log_query(question, answer, sources_used)
+        self.tracker.log_query(question, answer, self._sources_used())
         
         return answer
     
+    def stream_with_sources(self, question: str, use_cache: bool = True) -> Iterator[Tuple[str, List[str]]]:
+        """
+        Stream the answer as it is generated
+        
+        Yields (token, sources_used) tuples. A semantic cache hit is yielded
+        as a single chunk. The query is logged once the full answer has
+        been streamed.
+        """
+        sources_used = self._sources_used()
+        vector = self._question_vector(question) if use_cache else None
+        cached = self._semantic_lookup(vector) if use_cache else None
+        
+        if cached is not None:
+            yield cached, sources_used
+            answer = cached
+        else:
+            tokens = []
+            for token in self.chain.stream(question):
+                tokens.append(token)
+                yield token, sources_used
+            answer = "".join(tokens)
+            if use_cache:
+                self._qa_cache.append((vector, answer))
+        
+        self.tracker.log_query(question, answer, sources_used)
+    
     def invoke_with_sources(self, question: str) -> Dict:
         """Invoke and return answer with source information"""
         answer = self.invoke(question)
@@ -622,7 +949,7 @@ ANSWER:"""
         Returns:
             List of dicts with 'question' and 'answer' keys
         """
-        print(f"\n🤖 Generating {num_questions} questions about the video...")
+        logger.info("🤖 Generating %s questions about the video...", num_questions)
         
         # Get video title for context
         video_title = self.metadata.get('title', 'this video')
@@ -658,32 +985,22 @@ Return ONLY the questions, one per line, numbered 1-{num_questions}."""
             # Generate answers for each question
             qa_pairs = []
             for i, question in enumerate(questions, 1):
-                print(f"  Answering question {i}/{len(questions)}...")
+                logger.debug("Answering question %s/%s...", i, len(questions))
                 answer = self.invoke(question)
                 qa_pairs.append({
                     'question': question,
                     'answer': answer
                 })
             
-            print(f"✓ Generated {len(qa_pairs)} Q&A pairs\n")
+            logger.info("✓ Generated %s Q&A pairs", len(qa_pairs))
             return qa_pairs
             
         except Exception as e:
-            print(f"Error generating Q&A: {e}")
+            logger.warning("Error generating Q&A: %s", e)
             return []
     
-    def generate_summary(self, summary_type: str = "comprehensive") -> Dict[str, str]:
-        """
-        Generate different types of summaries for the video
-        
-        Args:
-            summary_type: Type of summary - 'brief', 'detailed', 'comprehensive', 'bullet_points'
-            
-        Returns:
-            Dict with summary content and metadata
-        """
-        print(f"\n📝 Generating {summary_type} summary...")
-        
+    def _summary_prompt(self, summary_type: str) -> str:
+        """Prompt for a summary type (falls back to comprehensive)"""
         video_title = self.metadata.get('title', 'this video')
         
         prompts = {
@@ -729,11 +1046,31 @@ Be concise and actionable.""",
 Keep it to 1-2 sentences maximum. Make it catchy and informative."""
         }
         
+        return prompts.get(summary_type, prompts['comprehensive'])
+    
+    def stream_summary(self, summary_type: str = "comprehensive") -> Iterator[str]:
+        """Stream a summary as it is generated (same prompts as generate_summary)"""
+        for token, _ in self.stream_with_sources(self._summary_prompt(summary_type), use_cache=False):
+            yield token
+    
+    def generate_summary(self, summary_type: str = "comprehensive") -> Dict[str, str]:
+        """
+        Generate different types of summaries for the video
+        
+        Args:
+            summary_type: Type of summary - 'brief', 'detailed', 'comprehensive', 'bullet_points'
+            
+        Returns:
+            Dict with summary content and metadata
+        """
+        logger.info("📝 Generating %s summary...", summary_type)
+        
+        video_title = self.metadata.get('title', 'this video')
+        
         try:
-            prompt = prompts.get(summary_type, prompts['comprehensive'])
-            summary = self.invoke(prompt)
+            summary = self.invoke(self._summary_prompt(summary_type), use_cache=False)
             
-            print(f"✓ {summary_type.title()} summary generated\n")
+            logger.info("✓ %s summary generated", summary_type.title())
             
             return {
                 'type': summary_type,
@@ -743,25 +1080,61 @@ Keep it to 1-2 sentences maximum. Make it catchy and informative."""
             }
             
         except Exception as e:
-            print(f"Error generating summary: {e}")
+            logger.warning("Error generating summary: %s", e)
             return {
                 'type': summary_type,
                 'summary': f"Error generating summary: {str(e)}",
                 'video_title': video_title,
-                'generated_at': datetime.now().isoformat()
+                'generated_at': datetime.now().isoformat(),
+                'error': True
             }
     
     def generate_all_summaries(self) -> Dict[str, Dict]:
-        """Generate all types of summaries"""
-        print("\n📚 Generating all summary types...")
+        """
+        Generate all types of summaries
+        
+        Asks for every style in one completion, so the retrieved context is
+        sent once instead of five times. Falls back to one call per type if
+        the reply isn't the expected JSON.
+        """
+        logger.info("📚 Generating all summary types...")
         
-        summaries = {}
+        video_title = self.metadata.get('title', 'this video')
         summary_types = ['tldr', 'brief', 'bullet_points', 'detailed', 'comprehensive']
         
-        for stype in summary_types:
-            summaries[stype] = self.generate_summary(stype)
+        prompt = f"""Summarize the video titled "{video_title}" in five different styles.
+
+Return ONLY a JSON object (no markdown fences) with these keys, each a string:
+- "tldr": 1-2 catchy, informative sentences
+- "brief": 2-3 sentences on the main topic and key takeaway
+- "bullet_points": bullet points covering the main topic, key points, important details and conclusion
+- "detailed": clear paragraphs covering context, 3-5 key points, examples and conclusions
+- "comprehensive": a thorough, well-organized summary with overview, main topics, key insights, examples/evidence and conclusions"""
         
-        print(f"✓ Generated {len(summaries)} different summaries\n")
+        try:
+            reply = self.invoke(prompt, use_cache=False)
+            # strict=False accepts the raw newlines models put in multi-paragraph values
+            parsed = json.loads(reply[reply.index('{'):reply.rindex('}') + 1], strict=False)
+            
+            generated_at = datetime.now().isoformat()
+            summaries = {}
+            for stype in summary_types:
+                text = parsed[stype]
+                if isinstance(text, list):
+                    text = "\n".join(f"• {item}" for item in text)
+                summaries[stype] = {
+                    'type': stype,
+                    'summary': str(text),
+                    'video_title': video_title,
+                    'generated_at': generated_at
+                }
+            
+        except (ValueError, KeyError, TypeError) as e:
+            # ValueError covers both a missing brace and json.JSONDecodeError
+            logger.warning("Combined summary reply unusable (%s), generating each type separately", e)
+            summaries = {stype: self.generate_summary(stype) for stype in summary_types}
+        
+        logger.info("✓ Generated %s different summaries", len(summaries))
         return summaries
 
 # ==================== HELPER FUNCTIONS ====================
@@ -788,10 +1161,14 @@ def print_config_options():
     
     print("\n" + "="*60 + "\n")
 
-def create_rag_system(url: str, config: Optional[EnrichmentConfig] = None):
+def create_rag_system(url: str, config: Optional[EnrichmentConfig] = None,
+                      progress_state: Optional[Dict] = None):
     """
     Create complete RAG system with tracking
     
+    progress_state, if given, is updated in place with 'pct' (0-100) and
+    'stage_name' so callers on another thread can display progress.
+    
     Returns:
         - rag_chain: TrackedRAGChain for asking questions
         - source_tracker: SourceTracker for analysis
@@ -800,23 +1177,99 @@ def create_rag_system(url: str, config: Optional[EnrichmentConfig] = None):
     if config is None:
         config = EnrichmentConfig.preset_balanced()
     
-    print(f"\n{'='*60}")
-    print(f"CREATING RAG SYSTEM")
-    print(f"Configuration: {config.strategies if config.enabled else 'Transcript Only'}")
-    print(f"{'='*60}\n")
+    logger.info("Creating RAG system (configuration: %s)",
+                config.strategies if config.enabled else 'Transcript Only')
     
     # Load and enrich
-    docs, metadata, tracker = load_and_enrich_documents(url, config)
+    docs, metadata, tracker = load_and_enrich_documents(url, config, progress_state=progress_state)
     
     # Create vector store
+    report_progress(progress_state, 50, "🧠 Step 3/4: Creating embeddings...")
     vector_store = create_vector_store(docs)
     
     # Create RAG chain with tracking
+    report_progress(progress_state, 75, "✨ Step 4/4: Building RAG chain...")
     rag_chain = TrackedRAGChain(vector_store, metadata, tracker)
+    report_progress(progress_state, 100, "✅ Done")
+    
+    logger.info("✓ RAG system ready")
+    
+    return rag_chain, tracker, metadata
+
+def _rag_cache_path(video_id: str, config: EnrichmentConfig) -> str:
+    """Directory holding the persisted index for a video/config pair"""
+    config_json = json.dumps(config.to_dict(), sort_keys=True)
+    # Chunking and quantization change the index contents, so they're part of the key
+    index_settings = f"{CHUNK_SIZE}:{CHUNK_OVERLAP}:{int(QUANTIZE_INDEX)}"
+    key = hashlib.sha256((video_id + config_json + index_settings).encode('utf-8')).hexdigest()[:16]
+    return os.path.join(RAG_CACHE_DIR, key)
+
+def _load_vector_store(cache_path: str):
+    """
+    Reopen an index written by FAISS.save_local, memory-mapped when possible
+    IO_FLAG_MMAP only maps IVF inverted lists (the IVFPQ indexes);
+    IO_FLAG_MMAP_IFC, on faiss builds that have it, also maps the flat and
+    SQ code storage behind HNSW. The HNSW graph links are always read into
+    memory, and builds without MMAP_IFC read HNSW indexes fully
+    """
+    index_path = os.path.join(cache_path, "index.faiss")
+    mmap_flags = faiss.IO_FLAG_MMAP | getattr(faiss, 'IO_FLAG_MMAP_IFC', 0)
+    try:
+        index = faiss.read_index(index_path, mmap_flags | faiss.IO_FLAG_READ_ONLY)
+    except RuntimeError as e:
+        logger.warning("Index can't be memory-mapped, reading it fully: %s", e)
+        index = faiss.read_index(index_path)
+    
+    # Same pickle save_local writes; only ever written by cached_create_rag_system
+    with open(os.path.join(cache_path, "index.pkl"), 'rb') as f:
+        docstore, index_to_docstore_id = pickle.load(f)
+    
+    return FAISS(
+        embedding_function=get_embeddings(),
+        index=index,
+        docstore=docstore,
+        index_to_docstore_id=index_to_docstore_id
+    )
+
+def cached_create_rag_system(url: str, config: Optional[EnrichmentConfig] = None,
+                             progress_state: Optional[Dict] = None):
+    """
+    Create RAG system, reusing the index built earlier for the same video and config
+    
+    The FAISS index is saved under RAG_CACHE_DIR/<hash of video_id + config>
+    next to a pickle of the tracker and metadata, and reused for
+    RAG_CACHE_TTL seconds. A hit skips transcript fetch, enrichment and
+    embedding; only the LLM chain is rebuilt since it can't be pickled.
+    """
+    if config is None:
+        config = EnrichmentConfig.preset_balanced()
+    
+    cache_path = _rag_cache_path(extract_video_id(url), config)
+    meta_path = os.path.join(cache_path, "meta.pkl")
+    
+    # meta.pkl is written last, so its presence means the entry is complete
+    if os.path.exists(meta_path) and time.time() - os.path.getmtime(meta_path) < RAG_CACHE_TTL:
+        logger.info("✓ Loading RAG system from cache: %s", cache_path)
+        report_progress(progress_state, 75, "✨ Loading cached index...")
+        try:
+            with open(meta_path, 'rb') as f:
+                tracker, metadata = pickle.load(f)
+            metadata['source'] = url
+            vector_store = _load_vector_store(cache_path)
+            rag_chain = TrackedRAGChain(vector_store, metadata, tracker)
+            report_progress(progress_state, 100, "✅ Done")
+            return rag_chain, tracker, metadata
+        except Exception as e:
+            # A damaged entry would otherwise fail this video until it expires
+            logger.warning("Cached RAG system unusable, rebuilding: %s", e)
+    
+    rag_chain, tracker, metadata = create_rag_system(url, config, progress_state)
     
-    print(f"\n{'='*60}")
-    print("✓ RAG SYSTEM READY")
-    print(f"{'='*60}\n")
+    rag_chain.vector_store.save_local(cache_path)
+    # Write to a temp file and rename, so a reader never sees a partial meta.pkl
+    with tempfile.NamedTemporaryFile('wb', dir=cache_path, suffix='.tmp', delete=False) as f:
+        pickle.dump((tracker, metadata), f)
+    os.replace(f.name, meta_path)
     
     return rag_chain, tracker, metadata
 
@@ -827,6 +1280,7 @@ if __name__ == "__main__":
     """
     Example usage demonstrating all features
     """
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     
     # Show available configurations
     print_config_options()
@@ -848,7 +1302,7 @@ if __name__ == "__main__":
     
     # Get source summary
     print("\nSource Summary:")
-    print(json.dumps(tracker.get_summary(), indent=2))
+    print(orjson.dumps(tracker.get_summary(), option=orjson.OPT_INDENT_2).decode())
     
     # Export tracking report
     tracker.export_report("source_report.json")
@@ -0,0 +1,82 @@
+"""
+Static UI data for the Streamlit app
+
+Streamlit re-executes app.py from the top on every rerun, so constants
+defined there are rebuilt on each widget interaction. Imported modules are
+cached in sys.modules, so these are built once per process.
+"""
+
+# ==================== ENRICHMENT PRESETS ====================
+
+# Display label -> preset key
+PRESET_OPTIONS = {
+    "Transcript Only (Fastest)": "transcript_only",
+    "Minimal (Background)": "minimal",
+    "Balanced (Recommended)": "balanced",
+    "Comprehensive (All Sources)": "comprehensive",
+    "Academic (Research Focus)": "academic"
+}
+
+PRESET_INFO = {
+    "transcript_only": {"strategies": [], "desc": "Video transcript only - fastest and most accurate to video content"},
+    "minimal": {"strategies": ["background"], "desc": "Adds basic background context"},
+    "balanced": {"strategies": ["background", "discussions"], "desc": "Best balance of accuracy and context"},
+    "comprehensive": {"strategies": ["background", "discussions", "academic", "current"], "desc": "Most thorough, includes all sources"},
+    "academic": {"strategies": ["background", "academic"], "desc": "Focus on research and scholarly sources"}
+}
+
+# Preset key -> EnrichmentConfig factory name (resolved lazily, so importing
+# this module doesn't pull in the RAG pipeline)
+CONFIG_FACTORIES = {
+    "transcript_only": "transcript_only",
+    "minimal": "preset_minimal",
+    "balanced": "preset_balanced",
+    "comprehensive": "preset_comprehensive",
+    "academic": "preset_academic"
+}
+
+# ==================== SUMMARIES ====================
+
+# Selectbox label -> summary type (dict order is the selectbox order)
+SUMMARY_TYPE_MAP = {
+    "TL;DR (1-2 sentences)": "tldr",
+    "Brief (2-3 sentences)": "brief",
+    "Bullet Points": "bullet_points",
+    "Detailed": "detailed",
+    "Comprehensive": "comprehensive"
+}
+
+# Summary type -> heading shown above the generated summary
+SUMMARY_TYPE_DISPLAY = {
+    'tldr': '⚡ TL;DR',
+    'brief': '📄 Brief',
+    'bullet_points': '📌 Bullet Points',
+    'detailed': '📖 Detailed',
+    'comprehensive': '📚 Comprehensive'
+}
+
+# ==================== STATIC HTML ====================
+
+CUSTOM_CSS = """
+    <style>
+    .source-box {
+        background-color: #f0f2f6;
+        padding: 10px;
+        border-radius: 5px;
+        margin: 5px 0;
+    }
+    .metric-card {
+        background-color: #e8f4f8;
+        padding: 15px;
+        border-radius: 8px;
+        text-align: center;
+    }
+    </style>
+"""
+
+FOOTER_HTML = """
+    <div style='text-align: center; color: #666;'>
+        <p>Built with Streamlit | Powered by Groq & Serper API</p>
+        <p>Week 1-2: Smart Enrichment + Configuration + Source Tracking ✅</p>
+    </div>
+"""
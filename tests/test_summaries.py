@@ -0,0 +1,38 @@
+"""
+Parsing of the single-call reply behind TrackedRAGChain.generate_all_summaries
+"""
+import os
+
+import pytest
+
+
+@pytest.fixture(scope="module")
+def rag_pipeline(tmp_path_factory):
+    os.environ.setdefault("RAG_CACHE_DIR", str(tmp_path_factory.mktemp("rag_cache")))
+    return pytest.importorskip("src.rag_pipeline")
+
+
+def chain_replying(rag_pipeline, reply):
+    """A TrackedRAGChain whose LLM always returns reply, counting the calls"""
+    chain = object.__new__(rag_pipeline.TrackedRAGChain)
+    chain.metadata = {'title': 'Sample'}
+    chain.calls = []
+    chain.invoke = lambda prompt, use_cache=True: chain.calls.append(prompt) or reply
+    return chain
+
+
+def test_raw_newlines_in_values_are_accepted(rag_pipeline):
+    # Unescaped newlines inside strings, as models often write them
+    reply = """Here you go:
+{"tldr": "Short.", "brief": "Two sentences. Really.",
+ "bullet_points": ["First point", "Second point"],
+ "detailed": "Paragraph one.
+
+Paragraph two.",
+ "comprehensive": "Overview.
+Details."}"""
+    chain = chain_replying(rag_pipeline, reply)
+    summaries = chain.generate_all_summaries()
+    assert len(chain.calls) == 1
+    assert summaries['detailed']['summary'] == "Paragraph one.\n\nParagraph two."
+    assert summaries['bullet_points']['summary'] == "• First point\n• Second point"
@@ -0,0 +1,72 @@
+"""
+Build, save and query the IVFPQ index used for long videos
+
+Embeddings are seeded random vectors keyed on the text, so the test runs
+offline and a chunk's own text embeds to exactly its stored vector.
+"""
+import os
+import zlib
+
+import numpy as np
+import pytest
+
+Embeddings = pytest.importorskip("langchain_core.embeddings").Embeddings
+
+
+class HashEmbeddings(Embeddings):
+    """Deterministic stand-in for the sentence-transformer embeddings"""
+    dim = 64
+
+    def _embed(self, text):
+        rng = np.random.default_rng(zlib.crc32(text.encode("utf-8")))
+        vec = rng.standard_normal(self.dim).astype(np.float32)
+        return (vec / np.linalg.norm(vec)).tolist()
+
+    def embed_documents(self, texts):
+        return [self._embed(t) for t in texts]
+
+    def embed_query(self, text):
+        return self._embed(text)
+
+
+@pytest.fixture(scope="module")
+def rag_pipeline(tmp_path_factory):
+    """src.rag_pipeline with HashEmbeddings in place of the real model"""
+    os.environ.setdefault("RAG_CACHE_DIR", str(tmp_path_factory.mktemp("rag_cache")))
+    module = pytest.importorskip("src.rag_pipeline")
+    mp = pytest.MonkeyPatch()
+    mp.setattr(module, "get_embeddings", HashEmbeddings)
+    yield module
+    mp.undo()
+
+
+@pytest.fixture(scope="module")
+def documents(rag_pipeline):
+    # One chunk per document, just enough to switch to IVFPQ
+    return [f"segment {i} of a long lecture" for i in range(rag_pipeline.IVFPQ_MIN_CHUNKS)]
+
+
+@pytest.fixture(scope="module")
+def ivfpq_store(rag_pipeline, documents):
+    return rag_pipeline.create_vector_store(documents)
+
+
+def test_long_videos_use_ivfpq(rag_pipeline, ivfpq_store, documents):
+    import faiss
+    index = ivfpq_store.index
+    assert isinstance(index, faiss.IndexIVFPQ)
+    assert index.ntotal == len(documents)
+    assert index.pq.nbits == rag_pipeline.IVFPQ_NBITS
+
+
+def test_ivfpq_store_finds_chunks(ivfpq_store, documents):
+    for text in documents[::500]:
+        hits = ivfpq_store.similarity_search(text, k=5)
+        assert text in [doc.page_content for doc in hits]
+
+
+def test_ivfpq_store_round_trips(rag_pipeline, ivfpq_store, documents, tmp_path):
+    ivfpq_store.save_local(str(tmp_path))
+    loaded = rag_pipeline._load_vector_store(str(tmp_path))
+    hits = loaded.similarity_search(documents[1234], k=5)
+    assert documents[1234] in [doc.page_content for doc in hits]
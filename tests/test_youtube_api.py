@@ -0,0 +1,59 @@
+"""
+Check transcript parsing against a saved YouTube Transcript API response
+
+tests/fixtures/sample_transcript.json holds entries in the API's raw format
+(FetchedTranscript.to_raw_data()), so the tests run offline. The committed
+sample is a short hand-written stand-in; replace it with a live capture via
+    python tests/test_youtube_api.py --refresh <video_id>
+"""
+import json
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+FIXTURE_PATH = Path(__file__).parent / "fixtures" / "sample_transcript.json"
+
+
+@pytest.fixture(scope="session")
+def transcript():
+    """Transcript entries as dicts, loaded from the committed fixture"""
+    return json.loads(FIXTURE_PATH.read_text(encoding="utf-8"))
+
+
+@pytest.fixture(scope="session")
+def rag_pipeline(tmp_path_factory):
+    """src.rag_pipeline, with its disk caches kept out of the source tree"""
+    os.environ.setdefault("RAG_CACHE_DIR", str(tmp_path_factory.mktemp("rag_cache")))
+    return pytest.importorskip("src.rag_pipeline")
+
+
+def test_transcript_has_entries(transcript):
+    assert len(transcript) > 0
+    assert {'text', 'start', 'duration'} <= transcript[0].keys()
+
+
+def test_extract_text_from_raw_entries(rag_pipeline, transcript):
+    expected = " ".join(e['text'] for e in transcript)
+    assert rag_pipeline.extract_text_from_transcript(transcript) == expected
+
+
+def test_extract_text_from_fetched_transcript(rag_pipeline, transcript):
+    from youtube_transcript_api import FetchedTranscript, FetchedTranscriptSnippet
+    fetched = FetchedTranscript(
+        snippets=[FetchedTranscriptSnippet(**e) for e in transcript],
+        video_id="sample",
+        language="English",
+        language_code="en",
+        is_generated=False
+    )
+    expected = " ".join(e['text'] for e in transcript)
+    assert rag_pipeline.extract_text_from_transcript(fetched) == expected
+
+
+if __name__ == "__main__" and sys.argv[1:2] == ["--refresh"] and len(sys.argv) == 3:
+    from youtube_transcript_api import YouTubeTranscriptApi
+    entries = YouTubeTranscriptApi().fetch(sys.argv[2]).to_raw_data()
+    FIXTURE_PATH.write_text(json.dumps(entries, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+    print(f"✓ Saved {len(entries)} entries to {FIXTURE_PATH}")